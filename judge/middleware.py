@@ -126,7 +126,7 @@ class SubdomainMiddleware(object):
 
         try:
             organization = Organization.objects.get(slug=subdomain)
-            if request.profile and organization in request.profile.organizations.all():
+            if request.profile and organization.id in request.profile.organization_ids:
                 request.organization = organization
             else:
                 if request.profile:
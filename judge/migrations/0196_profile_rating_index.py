@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("judge", "0195_signature_grader"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(
+                fields=["is_unlisted", "rating"],
+                name="judge_profi_is_unli_23d7f6_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("judge", "0196_profile_rating_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["content_type", "object_id", "hidden"],
+                name="judge_comme_content_50dccb_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="comment",
+            name="judge_comme_content_2dce05_idx",
+        ),
+    ]
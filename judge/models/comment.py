@@ -65,7 +65,7 @@ class Comment(MPTTModel):
         verbose_name = _("comment")
         verbose_name_plural = _("comments")
         indexes = [
-            models.Index(fields=["content_type", "object_id"]),
+            models.Index(fields=["content_type", "object_id", "hidden"]),
         ]
 
     class MPTTMeta:
@@ -73,7 +73,11 @@ class Comment(MPTTModel):
 
     @classmethod
     def most_recent(cls, user, n, batch=None, organization=None):
-        queryset = cls.objects.filter(hidden=False).order_by("-id")
+        queryset = (
+            cls.objects.filter(hidden=False)
+            .order_by("-id")
+            .prefetch_related("linked_object")
+        )
 
         if organization:
             queryset = queryset.filter(author__in=organization.members.all())
@@ -83,7 +87,7 @@ class Comment(MPTTModel):
         blog_access = CacheDict(lambda b: b.is_accessible_by(user))
 
         if n == -1:
-            n = len(queryset)
+            n = queryset.count()
         if user.is_superuser:
             return queryset[:n]
         if batch is None:
@@ -177,3 +181,13 @@ def get_visible_comment_count(content_type, object_id):
     return Comment.objects.filter(
         content_type=content_type, object_id=object_id, hidden=False
     ).count()
+
+
+def prefetch_visible_comment_counts(objects):
+    objects = list(objects)
+    if not objects:
+        return
+    content_type = ContentType.objects.get_for_model(objects[0])
+    get_visible_comment_count.prefetch_multi(
+        [(content_type, obj.pk) for obj in objects]
+    )
@@ -113,7 +113,7 @@ class BlogPost(models.Model, PageVotable, Bookmarkable):
             if (
                 user.is_authenticated
                 and self.organizations.filter(
-                    id__in=user.profile.organizations.all()
+                    id__in=user.profile.organization_ids
                 ).exists()
             ):
                 return True
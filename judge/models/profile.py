@@ -271,6 +271,10 @@ class Profile(models.Model):
         orgs = self.organizations.all()
         return orgs[0] if orgs else None
 
+    @cached_property
+    def organization_ids(self):
+        return frozenset(self.organizations.values_list("id", flat=True))
+
     @cached_property
     def username(self):
         try:
@@ -367,6 +371,12 @@ class Profile(models.Model):
         from judge.models import ContestParticipation
 
         try:
+            if self.current_contest_id is not None and not (
+                Profile.current_contest.is_cached(self)
+            ):
+                self.current_contest = ContestParticipation.objects.select_related(
+                    "contest"
+                ).get(id=self.current_contest_id)
             contest = self.current_contest
             if contest is not None and (
                 contest.ended or not contest.contest.is_accessible_by(self.user)
@@ -420,6 +430,7 @@ class Profile(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["is_unlisted", "performance_points"]),
+            models.Index(fields=["is_unlisted", "rating"]),
         ]
         permissions = (
             ("test_site", "Shows in-progress development stuff"),
@@ -565,14 +576,22 @@ class OrganizationProfile(models.Model):
         self.remove_organization(profile, organization)
         new_row = OrganizationProfile(profile=profile, organization=organization)
         new_row.save()
+        _get_most_recent_organizations.dirty(profile.id)
 
     @classmethod
     def get_most_recent_organizations(cls, profile):
-        queryset = cls.objects.filter(profile=profile).order_by("-last_visit")[:5]
-        queryset = queryset.select_related("organization").defer("organization__about")
-        organizations = [op.organization for op in queryset]
-
-        return organizations
+        if profile is None:
+            return []
+        return _get_most_recent_organizations(profile.id)
+
+
+@cache_wrapper(prefix="OPgmro", timeout=300, expected_type=list)
+def _get_most_recent_organizations(profile_id):
+    queryset = OrganizationProfile.objects.filter(profile_id=profile_id).order_by(
+        "-last_visit"
+    )[:5]
+    queryset = queryset.select_related("organization").defer("organization__about")
+    return [op.organization for op in queryset]
 
 
 @receiver([post_save], sender=User)
@@ -53,6 +53,7 @@ def problem_update(sender, instance, **kwargs):
             make_template_fragment_key("submission_problem", (instance.id,)),
             "problem_tls:%s" % instance.id,
             "problem_mls:%s" % instance.id,
+            "feed:problem_count",
         ]
     )
     cache.delete_many(
@@ -75,6 +76,8 @@ def problem_update(sender, instance, **kwargs):
 
 @receiver(post_save, sender=Profile)
 def profile_update(sender, instance, **kwargs):
+    if kwargs.get("created"):
+        cache.delete("feed:user_count")
     get_points_rank.dirty(instance.id)
     get_rating_rank.dirty(instance.id)
     if hasattr(instance, "_updating_stats_only"):
@@ -110,7 +113,11 @@ def license_update(sender, instance, **kwargs):
 @receiver(post_save, sender=Language)
 def language_update(sender, instance, **kwargs):
     cache.delete_many(
-        [make_template_fragment_key("language_html", (instance.id,)), "lang:cn_map"]
+        [
+            make_template_fragment_key("language_html", (instance.id,)),
+            "lang:cn_map",
+            "feed:language_count",
+        ]
     )
 
 
@@ -130,6 +137,19 @@ def post_update(sender, instance, **kwargs):
     BlogPost.get_authors.dirty(instance)
 
 
+@receiver(post_delete, sender=Profile)
+@receiver(post_delete, sender=Problem)
+@receiver(post_delete, sender=Language)
+def home_count_delete(sender, instance, **kwargs):
+    cache.delete(
+        {
+            Profile: "feed:user_count",
+            Problem: "feed:problem_count",
+            Language: "feed:language_count",
+        }[sender]
+    )
+
+
 @receiver(post_delete, sender=Submission)
 def submission_delete(sender, instance, **kwargs):
     finished_submission(instance)
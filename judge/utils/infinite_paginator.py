@@ -3,6 +3,7 @@ import inspect
 from math import ceil
 
 from django.core.paginator import EmptyPage, InvalidPage
+from django.db.models.query import QuerySet
 from django.http import Http404
 from django.utils.functional import cached_property
 from django.utils.inspect import method_has_no_args
@@ -106,10 +107,29 @@ class DummyPaginator:
         self.per_page = per_page
 
 
-def infinite_paginate(queryset, page, page_size, pad_pages, paginator=None):
+def pk_slice(queryset, start, stop):
+    # Seek the page with a narrow primary key scan first, then load full rows
+    # by pk, so deep offsets do not have to read and discard whole records.
+    ids = list(queryset.values_list("pk", flat=True)[start:stop])
+    objects = {obj.pk: obj for obj in queryset.filter(pk__in=ids)}
+    return [objects[pk] for pk in ids if pk in objects]
+
+
+def infinite_paginate(
+    queryset, page, page_size, pad_pages, paginator=None, slice_by_pk=False
+):
     if page < 1:
         raise EmptyPage()
-    sliced = queryset[(page - 1) * page_size : page * page_size]
+    start, stop = (page - 1) * page_size, page * page_size
+    if (
+        slice_by_pk
+        and page > 1
+        and isinstance(queryset, QuerySet)
+        and not queryset.query.is_sliced
+    ):
+        sliced = pk_slice(queryset, start, stop)
+    else:
+        sliced = queryset[start:stop]
     if page > 1 and not sliced:
         raise EmptyPage()
     return InfinitePage(sliced, page, queryset, page_size, pad_pages, paginator)
@@ -117,11 +137,20 @@ def infinite_paginate(queryset, page, page_size, pad_pages, paginator=None):
 
 class InfinitePaginationMixin:
     pad_pages = 2
+    slice_by_pk = False
 
     @property
     def use_infinite_pagination(self):
         return True
 
+    def get_page_number(self):
+        page_kwarg = self.page_kwarg
+        page = self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg) or 1
+        try:
+            return int(page)
+        except ValueError:
+            raise Http404("Page cannot be converted to an int.")
+
     def paginate_queryset(self, queryset, page_size):
         if not self.use_infinite_pagination:
             paginator, page, object_list, has_other = super().paginate_queryset(
@@ -130,16 +159,16 @@ class InfinitePaginationMixin:
             paginator.is_infinite = False
             return paginator, page, object_list, has_other
 
-        page_kwarg = self.page_kwarg
-        page = self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg) or 1
-        try:
-            page_number = int(page)
-        except ValueError:
-            raise Http404("Page cannot be converted to an int.")
+        page_number = self.get_page_number()
         try:
             paginator = DummyPaginator(page_size)
             page = infinite_paginate(
-                queryset, page_number, page_size, self.pad_pages, paginator
+                queryset,
+                page_number,
+                page_size,
+                self.pad_pages,
+                paginator,
+                slice_by_pk=self.slice_by_pk,
             )
             return paginator, page, page.object_list, page.has_other_pages()
         except InvalidPage as e:
@@ -1,4 +1,4 @@
-from django.db import connections
+from django.db import connections, router
 from django.db.models.sql.constants import INNER, LOUTER
 from django.db.models.sql.datastructures import Join
 
@@ -100,3 +100,23 @@ def use_straight_join(queryset):
     except AttributeError:
         cloner = queryset.query.clone
     queryset.query = cloner(straight_join_cache[type(queryset.query)])
+
+
+def approx_count(model):
+    # Estimated row count of the whole table, for counters that need not be
+    # exact. On MySQL this reads InnoDB's estimate from information_schema;
+    # note that MySQL 8 caches TABLE_ROWS for information_schema_stats_expiry
+    # seconds (24 hours by default), so the value can lag that far behind.
+    connection = connections[router.db_for_read(model)]
+    if connection.vendor != "mysql":
+        return model.objects.count()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] is None:
+        return model.objects.count()
+    return row[0]
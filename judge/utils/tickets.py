@@ -1,21 +1,29 @@
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
+from django.db.models import OuterRef, Q, Subquery
 
-from judge.models import Problem
+from judge.models import Problem, Ticket, TicketMessage
 from judge.utils.problems import editable_problems
 
 
 def own_ticket_filter(profile_id):
-    return Q(assignees__id=profile_id) | Q(user_id=profile_id)
+    assigned_ticket_ids = Ticket.assignees.through.objects.filter(
+        profile_id=profile_id
+    ).values("ticket_id")
+    return Q(id__in=assigned_ticket_ids) | Q(user_id=profile_id)
 
 
 def filter_visible_tickets(queryset, user, profile=None):
     if profile is None:
         profile = user.profile
-    return queryset.filter(
-        own_ticket_filter(profile.id)
-        | Q(
-            content_type=ContentType.objects.get_for_model(Problem),
-            object_id__in=editable_problems(user, profile),
-        )
-    ).distinct()
+    problem_filter = Q(content_type=ContentType.objects.get_for_model(Problem))
+    if not user.has_perm("judge.edit_all_problem"):
+        problem_filter &= Q(object_id__in=editable_problems(user, profile).values("id"))
+    return queryset.filter(own_ticket_filter(profile.id) | problem_filter)
+
+
+def annotate_last_message(queryset):
+    last_message = TicketMessage.objects.filter(ticket=OuterRef("pk")).order_by("-id")
+    return queryset.annotate(
+        last_message_user_id=Subquery(last_message.values("user_id")[:1]),
+        last_message_body=Subquery(last_message.values("body")[:1]),
+    )
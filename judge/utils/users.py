@@ -65,3 +65,20 @@ def get_awards(profile):
     ]
 
     return result
+
+
+def _get_top_profiles(organization, field):
+    queryset = organization.members if organization else Profile.objects
+    return list(
+        queryset.filter(is_unlisted=False).order_by("-" + field).only("id", field)[:10]
+    )
+
+
+@cache_wrapper(prefix="gtrp", timeout=120)
+def get_top_rating_profiles(organization):
+    return _get_top_profiles(organization, "rating")
+
+
+@cache_wrapper(prefix="gtsp", timeout=120)
+def get_top_score_profiles(organization):
+    return _get_top_profiles(organization, "performance_points")
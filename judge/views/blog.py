@@ -1,4 +1,5 @@
-from django.db.models import Count, Max, Q
+from django.core.cache import cache
+from django.db.models import Count, Max, Prefetch, Q
 from django.http import Http404
 from django.urls import reverse
 from django.utils import timezone
@@ -20,87 +21,131 @@ from judge.models import (
     Submission,
     Ticket,
 )
+from judge.models.comment import prefetch_visible_comment_counts
 from judge.models.profile import Organization, OrganizationProfile
 from judge.utils.cachedict import CacheDict
 from judge.utils.diggpaginator import DiggPaginator
-from judge.utils.tickets import filter_visible_tickets
+from judge.utils.raw_sql import approx_count
+from judge.utils.tickets import (
+    annotate_last_message,
+    filter_visible_tickets,
+    own_ticket_filter,
+)
 from judge.utils.views import TitleMixin
-from judge.utils.users import get_rating_rank, get_points_rank, get_awards
+from judge.utils.users import (
+    get_rating_rank,
+    get_points_rank,
+    get_awards,
+    get_top_rating_profiles,
+    get_top_score_profiles,
+)
 from judge.views.feed import FeedView
 
 
+def cached_count(key, count, timeout=300):
+    return lazy(lambda: cache.get_or_set(key, count, timeout), int, int)
+
+
 # General view for all content list on home feed
 class HomeFeedView(FeedView):
     template_name = "blog/list.html"
     title = None
 
-    def get_context_data(self, **kwargs):
-        context = super(HomeFeedView, self).get_context_data(**kwargs)
-        context["has_clarifications"] = False
-        if self.request.user.is_authenticated:
-            participation = self.request.profile.current_contest
-            if participation:
-                clarifications = ContestProblemClarification.objects.filter(
-                    problem__in=participation.contest.contest_problems.all()
-                )
-                context["has_clarifications"] = clarifications.count() > 0
-                context["clarifications"] = clarifications.order_by("-date")
-                if participation.contest.is_editable_by(self.request.user):
-                    context["can_edit_contest"] = True
+    @property
+    def _organization_id(self):
+        return self.request.organization.id if self.request.organization else 0
 
-        now = timezone.now()
+    def get_unfinished_contests(self):
         visible_contests = (
             Contest.get_visible_contests(self.request.user, show_own_contests_only=True)
             .filter(is_visible=True, official__isnull=True)
             .order_by("start_time")
+            .only("key", "name", "start_time", "end_time")
         )
         if self.request.organization:
             visible_contests = visible_contests.filter(
                 is_organization_private=True, organizations=self.request.organization
             )
-        context["current_contests"] = visible_contests.filter(
-            start_time__lte=now, end_time__gt=now
+        return list(visible_contests.filter(end_time__gt=timezone.now()))
+
+    def split_contests(self, unfinished_contests):
+        # Split at request time, so a cached list never shows stale buckets.
+        now = timezone.now()
+        return {
+            "current_contests": [
+                contest
+                for contest in unfinished_contests
+                if contest.start_time <= now < contest.end_time
+            ],
+            "future_contests": [
+                contest for contest in unfinished_contests if contest.start_time > now
+            ],
+        }
+
+    def get_user_context(self):
+        # Contest visibility depends on the user, so these are cached per user.
+        unfinished_contests = cache.get_or_set(
+            "feed:contests:%d:%d" % (self.request.user.id, self._organization_id),
+            self.get_unfinished_contests,
+            60,
         )
-        context["future_contests"] = visible_contests.filter(start_time__gt=now)
+        context = self.split_contests(unfinished_contests)
+        participation = self.request.participation
+        if participation:
+            clarifications = list(
+                ContestProblemClarification.objects.filter(
+                    problem__contest=participation.contest
+                )
+                .select_related("problem__problem")
+                .order_by("-date")[:50]
+            )
+            context["has_clarifications"] = bool(clarifications)
+            context["clarifications"] = clarifications
+            if participation.contest.is_editable_by(self.request.user):
+                context["can_edit_contest"] = True
+
         context[
             "recent_organizations"
         ] = OrganizationProfile.get_most_recent_organizations(self.request.profile)
+        context["rating_rank"] = get_rating_rank(self.request.profile)
+        context["points_rank"] = get_points_rank(self.request.profile)
 
-        profile_queryset = Profile.objects
-        if self.request.organization:
-            profile_queryset = self.request.organization.members
-        context["top_rated"] = (
-            profile_queryset.filter(is_unlisted=False)
-            .order_by("-rating")
-            .only("id", "rating")[:10]
-        )
-        context["top_scorer"] = (
-            profile_queryset.filter(is_unlisted=False)
-            .order_by("-performance_points")
-            .only("id", "performance_points")[:10]
-        )
-        Profile.prefetch_profile_cache([p.id for p in context["top_rated"]])
-        Profile.prefetch_profile_cache([p.id for p in context["top_scorer"]])
+        medals_list = get_awards(self.request.profile)
+        context["awards"] = {
+            "medals": medals_list,
+            "gold_count": 0,
+            "silver_count": 0,
+            "bronze_count": 0,
+        }
+        for medal in medals_list:
+            if medal["ranking"] == 1:
+                context["awards"]["gold_count"] += 1
+            elif medal["ranking"] == 2:
+                context["awards"]["silver_count"] += 1
+            elif medal["ranking"] == 3:
+                context["awards"]["bronze_count"] += 1
+        return context
 
+    def get_context_data(self, **kwargs):
+        context = super(HomeFeedView, self).get_context_data(**kwargs)
+        context["has_clarifications"] = False
         if self.request.user.is_authenticated:
-            context["rating_rank"] = get_rating_rank(self.request.profile)
-            context["points_rank"] = get_points_rank(self.request.profile)
-
-            medals_list = get_awards(self.request.profile)
-            context["awards"] = {
-                "medals": medals_list,
-                "gold_count": 0,
-                "silver_count": 0,
-                "bronze_count": 0,
-            }
-            for medal in medals_list:
-                if medal["ranking"] == 1:
-                    context["awards"]["gold_count"] += 1
-                elif medal["ranking"] == 2:
-                    context["awards"]["silver_count"] += 1
-                elif medal["ranking"] == 3:
-                    context["awards"]["bronze_count"] += 1
+            context.update(self.get_user_context())
+        else:
+            # Anonymous users all see the same contests, so cache them once for all.
+            unfinished_contests = cache.get_or_set(
+                "feed:anon_contests:%d" % self._organization_id,
+                self.get_unfinished_contests,
+                60,
+            )
+            context.update(self.split_contests(unfinished_contests))
+            context["recent_organizations"] = []
 
+        context["top_rated"] = get_top_rating_profiles(self.request.organization)
+        context["top_scorer"] = get_top_score_profiles(self.request.organization)
+        Profile.prefetch_profile_cache(
+            {p.id for p in context["top_rated"] + context["top_scorer"]}
+        )
         return context
 
 
@@ -110,27 +155,51 @@ class PostList(HomeFeedView):
     context_object_name = "posts"
     feed_content_template_name = "blog/content.html"
     url_name = "blog_post_list"
+    slice_by_pk = True
 
     def get_queryset(self):
         queryset = (
             BlogPost.objects.filter(visible=True, publish_on__lte=timezone.now())
             .order_by("-sticky", "-publish_on")
-            .prefetch_related("organizations")
+            .prefetch_related(
+                Prefetch(
+                    "organizations",
+                    queryset=Organization.objects.only(
+                        "id", "name", "slug", "organization_image"
+                    ),
+                    to_attr="organization_list",
+                )
+            )
         )
         filter = Q(is_organization_private=False)
         if self.request.user.is_authenticated:
-            filter |= Q(organizations__in=self.request.profile.organizations.all())
+            filter |= Q(organizations__in=self.request.profile.organization_ids)
         if self.request.organization:
             filter &= Q(organizations=self.request.organization)
         queryset = queryset.filter(filter)
         return queryset
 
+    def get_feed_context(self, object_list):
+        prefetch_visible_comment_counts(object_list)
+        return {}
+
     def get_context_data(self, **kwargs):
         context = super(PostList, self).get_context_data(**kwargs)
+        prefetch_visible_comment_counts(context["posts"])
         context["title"] = (
             self.title or _("Page %d of Posts") % context["page_obj"].number
         )
         context["page_type"] = "blog"
+        context["user_count"] = cached_count("feed:user_count", Profile.objects.count)
+        context["problem_count"] = cached_count(
+            "feed:problem_count", Problem.objects.filter(is_public=True).count
+        )
+        context["submission_count"] = cached_count(
+            "feed:submission_count", lambda: approx_count(Submission)
+        )
+        context["language_count"] = cached_count(
+            "feed:language_count", Language.objects.count
+        )
         return context
 
 
@@ -144,10 +213,8 @@ class TicketFeed(HomeFeedView):
         profile = self.request.profile
         if is_own:
             if self.request.user.is_authenticated:
-                return (
-                    Ticket.objects.filter(
-                        Q(user=profile) | Q(assignees__in=[profile]), is_open=True
-                    )
+                return annotate_last_message(
+                    Ticket.objects.filter(own_ticket_filter(profile.id), is_open=True)
                     .order_by("-id")
                     .prefetch_related("linked_item")
                 )
@@ -161,7 +228,9 @@ class TicketFeed(HomeFeedView):
                     .filter(is_open=True)
                     .prefetch_related("linked_item")
                 )
-                return filter_visible_tickets(tickets, self.request.user, profile)
+                return annotate_last_message(
+                    filter_visible_tickets(tickets, self.request.user, profile)
+                )
             else:
                 return []
 
@@ -179,8 +248,11 @@ class CommentFeed(HomeFeedView):
     feed_content_template_name = "comments/feed.html"
 
     def get_queryset(self):
+        page = self.get_page_number()
+        # Only resolve visibility for the comments this page and its padding need.
+        n = min(100, (max(page, 1) + self.pad_pages) * self.paginate_by + 1)
         return Comment.most_recent(
-            self.request.user, 100, organization=self.request.organization
+            self.request.user, n, organization=self.request.organization
         )
 
     def get_context_data(self, **kwargs):
@@ -204,9 +276,10 @@ class PostView(TitleMixin, CommentedDetailView, PageVoteDetailView, BookMarkDeta
         context["og_image"] = self.object.og_image
         context["editable_orgs"] = []
 
-        orgs = list(self.object.organizations.all())
+        orgs = list(self.object.organizations.defer("about"))
 
         if self.request.profile:
+            Organization.get_admin_ids.prefetch_multi([(org,) for org in orgs])
             for org in orgs:
                 if self.request.profile.can_edit_organization(org):
                     context["editable_orgs"].append(org)
@@ -59,6 +59,7 @@ from judge.models import (
     ContestProblem,
     OrganizationProfile,
 )
+from judge.models.comment import prefetch_visible_comment_counts
 from judge.models.notification import make_notification
 from judge import event_poster as event
 from judge.utils.ranker import ranker
@@ -328,21 +329,23 @@ class OrganizationHome(OrganizationHomeView, FeedView):
     paginate_by = 4
     context_object_name = "posts"
     feed_content_template_name = "blog/content.html"
+    slice_by_pk = True
 
     def get_queryset(self):
-        return (
-            BlogPost.objects.filter(
-                visible=True,
-                publish_on__lte=timezone.now(),
-                is_organization_private=True,
-                organizations=self.organization,
-            )
-            .order_by("-sticky", "-publish_on")
-            .prefetch_related("authors__user", "organizations")
-        )
+        return BlogPost.objects.filter(
+            visible=True,
+            publish_on__lte=timezone.now(),
+            is_organization_private=True,
+            organizations=self.organization,
+        ).order_by("-sticky", "-publish_on")
+
+    def get_feed_context(self, object_list):
+        prefetch_visible_comment_counts(object_list)
+        return {}
 
     def get_context_data(self, **kwargs):
         context = super(OrganizationHome, self).get_context_data(**kwargs)
+        prefetch_visible_comment_counts(context["posts"])
         context["title"] = self.organization.name
 
         now = timezone.now()